@@ -14,20 +14,28 @@ Usage:
     # Optional: local validator RPC (for health checks)
     export SOLANA_LOCAL_RPC_URL="http://localhost:8899"
 
-    # Run exporter
-    uvicorn exporter:app --host 0.0.0.0 --port 8080
+    # Run exporter (uvloop + httptools, Linux/macOS)
+    uvicorn exporter:app --host 0.0.0.0 --port 8080 --loop uvloop --http httptools --no-access-log
 """
 
 import os
+import re
+import sys
 import time
 import asyncio
+import hashlib
 import logging
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple, Awaitable, Callable, Sequence
 
 import httpx
-from fastapi import FastAPI, Response
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from prometheus_client import CollectorRegistry, Gauge, generate_latest, CONTENT_TYPE_LATEST
+from prometheus_client.core import GaugeMetricFamily
 
 # Load .env file if it exists (looks for .env in current directory)
 try:
@@ -36,6 +44,12 @@ try:
 except ImportError:
     pass  # python-dotenv not installed, use shell environment only
 
+# msgspec decodes getBlock responses into just the fields we read (optional)
+try:
+    import msgspec
+except ImportError:
+    msgspec = None  # msgspec not installed, getBlock is decoded with orjson
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -43,6 +57,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class QuietPathsFilter(logging.Filter):
+    """Drop uvicorn access log lines for successful scrape and probe requests"""
+
+    QUIET_PATHS = ("/metrics", "/health")
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        # uvicorn.access args: (client_addr, method, path, http_version, status_code)
+        args = record.args
+        if isinstance(args, tuple) and len(args) == 5 and args[2] in self.QUIET_PATHS:
+            return args[4] >= 400
+        return True
+
+# Scrapes and probes would otherwise log a line every few seconds; failed ones are still logged
+logging.getLogger("uvicorn.access").addFilter(QuietPathsFilter())
+
+# httpx logs every RPC request at INFO
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
 # ------------------------
 # CONFIGURATION
 # ------------------------
@@ -53,6 +85,11 @@ class Config:
     RPC_URL: str = os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
     LOCAL_RPC_URL: Optional[str] = os.getenv("SOLANA_LOCAL_RPC_URL")  # Optional
 
+    # Backup RPC for hedged requests: batches still unanswered by RPC_URL after
+    # HEDGE_DELAY seconds are also sent here, and the first reply wins
+    HEDGE_URL: Optional[str] = os.getenv("SOLANA_RPC_HEDGE_URL")  # Optional
+    HEDGE_DELAY: float = float(os.getenv("SOLANA_RPC_HEDGE_DELAY_MS", "40")) / 1000
+
     # Validator keys
     IDENTITY_KEY: str = os.getenv("SOLANA_IDENTITY_KEY", "")
     VOTE_KEY: str = os.getenv("SOLANA_VOTE_KEY", "")
@@ -61,9 +98,38 @@ class Config:
     TIMEOUT: float = float(os.getenv("SOLANA_RPC_TIMEOUT", "10.0"))
     MAX_CONNECTIONS: int = int(os.getenv("SOLANA_MAX_CONNECTIONS", "20"))
 
+    # Concurrent getBlock requests (large responses), so they can't crowd out light RPCs
+    BLOCK_CONCURRENCY: int = int(os.getenv("SOLANA_BLOCK_CONCURRENCY", "5"))
+
+    # Consecutive timed-out refreshes a value may be carried over before it is
+    # dropped from /metrics (node health is never carried over)
+    MAX_STALE_REFRESHES: int = int(os.getenv("SOLANA_MAX_STALE_REFRESHES", "2"))
+
+    # Seconds a rendered /metrics body is reused across scrapes (0 = always refresh)
+    METRICS_CACHE_TTL: float = float(os.getenv("SOLANA_METRICS_CACHE_TTL", "5.0"))
+
+    # Seconds between background refreshes of fast-changing metrics
+    # (epoch progress, performance, vote account; 0 = refresh on scrape instead)
+    REFRESH_INTERVAL: float = float(os.getenv("SOLANA_REFRESH_INTERVAL", "10.0"))
+
+    # Seconds between background refreshes of slow-changing metrics
+    # (version, balances, block production, SOL price, rewards, fees; must be > 0)
+    SLOW_REFRESH_INTERVAL: float = float(os.getenv("SOLANA_SLOW_REFRESH_INTERVAL", "60.0"))
+
+    # Seconds between background refreshes of the /blocks leader slot table
+    # (0 = no refresher, /blocks fetches the table per request)
+    BLOCKS_REFRESH_INTERVAL: float = float(os.getenv("SOLANA_BLOCKS_REFRESH_INTERVAL", "10.0"))
+
     # SOL price (CoinGecko free API)
     COINGECKO_URL: str = "https://api.coingecko.com/api/v3/simple/price?ids=solana&vs_currencies=usd"
 
+    # Seconds a fetched SOL price is reused (CoinGecko free tier allows ~10 req/min)
+    PRICE_TTL: float = float(os.getenv("SOLANA_PRICE_TTL", "60"))
+
+    # uvicorn worker processes when run as a script. Each worker keeps its own
+    # snapshot and refresh loops, so RPC load scales with the worker count.
+    WORKERS: int = int(os.getenv("UVICORN_WORKERS", "1"))
+
     @classmethod
     def validate(cls):
         """Validate required configuration"""
@@ -71,11 +137,15 @@ class Config:
             logger.warning("SOLANA_IDENTITY_KEY not set - some metrics will be unavailable")
         if not cls.VOTE_KEY:
             logger.warning("SOLANA_VOTE_KEY not set - some metrics will be unavailable")
+        if cls.REFRESH_INTERVAL > 0 and cls.SLOW_REFRESH_INTERVAL <= 0:
+            raise ValueError("SOLANA_SLOW_REFRESH_INTERVAL must be greater than 0")
         if not cls.LOCAL_RPC_URL:
             logger.info("SOLANA_LOCAL_RPC_URL not set - local health checks disabled")
 
         logger.info(f"RPC URL: {cls.RPC_URL}")
         logger.info(f"Local RPC URL: {cls.LOCAL_RPC_URL or 'disabled'}")
+        if cls.HEDGE_URL:
+            logger.info(f"Hedge RPC URL: {cls.HEDGE_URL} (after {cls.HEDGE_DELAY * 1000:.0f}ms)")
         logger.info(f"Identity Key: {cls.IDENTITY_KEY[:20]}..." if cls.IDENTITY_KEY else "Identity Key: not set")
         logger.info(f"Vote Key: {cls.VOTE_KEY[:20]}..." if cls.VOTE_KEY else "Vote Key: not set")
 
@@ -84,24 +154,90 @@ Config.validate()
 # ------------------------
 # APP SETUP
 # ------------------------
-app = FastAPI(title="Solana Validator Exporter", version="1.0.0")
+app = FastAPI(title="Solana Validator Exporter", version="1.0.0", default_response_class=ORJSONResponse)
+
+# Prometheus sends Accept-Encoding: gzip; text exposition compresses well
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=4)
 
 # Global HTTP client with connection pooling
 http_client: Optional[httpx.AsyncClient] = None
 
+# Rendered /metrics body shared between overlapping scrapes
+# (exp = monotonic time it goes stale, hash = digest of the data the body was
+#  rendered from, etag = that digest as an ETag)
+_cache: Dict[str, Any] = {"body": None, "exp": 0.0, "hash": None, "etag": None}
+
+# Monotonic time each refresh tier last completed, for its snapshot age
+_tier_ts: Dict[str, float] = {}
+
+# Whether each tier's last refresh timed out on some fetches (partial scrape)
+_tier_partial: Dict[str, bool] = {}
+
+# Refresh started by a scrape, awaited by every scrape that arrives while it runs
+_inflight: Optional[asyncio.Task] = None
+
+# Latest collected data, merged from every refresh tier; _cache is rendered from it
+# (_state_lock is created in startup_event, like the other asyncio primitives)
+_state: Dict[str, Any] = {}
+_state_lock: Optional[asyncio.Lock] = None
+
+# Set when leader_slots_assigned in _state is behind the current epoch
+_epoch_changed: Optional[asyncio.Event] = None
+
+# Set once the first refresh has rendered a body; in background mode /metrics
+# waits on it instead of collecting alongside the refreshers
+_snapshot_ready: Optional[asyncio.Event] = None
+
+# /blocks table kept by the background refresher; separate from _state so
+# rebuilding it doesn't re-render /metrics or touch the scrape metadata
+_blocks_table: Dict[str, Any] = {"data": None}
+
+# Background tasks keeping _state fresh (empty when refreshing on scrape)
+_refresh_tasks: List[asyncio.Task] = []
+
 @app.on_event("startup")
 async def startup_event():
-    """Initialize HTTP client on startup"""
-    global http_client
+    """Initialize HTTP client, asyncio primitives and background refreshers on startup"""
+    global http_client, _state_lock, _epoch_changed, _snapshot_ready, _sol_price_lock, _block_sem
+
+    # Before Python 3.10 these bind to the event loop current at creation, and
+    # uvicorn.run() serves on a new loop, so they can't be created at import
+    _state_lock = asyncio.Lock()
+    _epoch_changed = asyncio.Event()
+    _snapshot_ready = asyncio.Event()
+    _sol_price_lock = asyncio.Lock()
+    _block_sem = asyncio.Semaphore(Config.BLOCK_CONCURRENCY)
+
     http_client = httpx.AsyncClient(
+        http2=True,
         timeout=httpx.Timeout(Config.TIMEOUT, connect=5.0),
-        limits=httpx.Limits(max_keepalive_connections=10, max_connections=Config.MAX_CONNECTIONS)
+        limits=httpx.Limits(
+            max_keepalive_connections=Config.MAX_CONNECTIONS,
+            max_connections=Config.MAX_CONNECTIONS,
+            # Below nginx's 75s keepalive_timeout, so we never reuse a socket the proxy already closed
+            keepalive_expiry=60.0
+        )
     )
+
+    # Warm up the connection so the first scrape skips the TLS/HTTP2 handshake
+    await rpc_call(Config.RPC_URL, "getVersion")
+
+    if Config.REFRESH_INTERVAL > 0:
+        _refresh_tasks.extend([
+            asyncio.create_task(_refresh_loop(fetch_fast_metrics, Config.REFRESH_INTERVAL, "fast")),
+            asyncio.create_task(_refresh_loop(fetch_slow_metrics, Config.SLOW_REFRESH_INTERVAL, "slow")),
+            asyncio.create_task(_epoch_loop()),
+        ])
+        if Config.IDENTITY_KEY and Config.BLOCKS_REFRESH_INTERVAL > 0:
+            _refresh_tasks.append(asyncio.create_task(_blocks_loop()))
     logger.info("Exporter started successfully")
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Clean up HTTP client on shutdown"""
+    """Stop background refreshers and clean up HTTP client on shutdown"""
+    for task in _refresh_tasks:
+        task.cancel()
+    await asyncio.gather(*_refresh_tasks, return_exceptions=True)
     if http_client:
         await http_client.aclose()
     logger.info("Exporter shutdown complete")
@@ -109,7 +245,49 @@ async def shutdown_event():
 # ------------------------
 # RPC CLIENT
 # ------------------------
-async def rpc_call(url: str, method: str, params: Optional[List] = None) -> Dict[str, Any]:
+JSON_HEADERS = {"content-type": "application/json"}
+
+# Parameterless methods called on every refresh; their requests are built once and re-sent
+STATIC_METHODS = frozenset({"getHealth", "getVersion"})
+_static_requests: Dict[Tuple[str, str], httpx.Request] = {}
+
+async def send_json(request: httpx.Request, decode: Callable[[bytes], Any] = orjson.loads) -> Any:
+    """
+    Send a prepared request and decode the JSON response (orjson by default)
+
+    Raises:
+        httpx.HTTPError on transport errors or non-2xx status
+    """
+    response = await http_client.send(request)
+    response.raise_for_status()
+    return decode(response.content)
+
+async def post_json(url: str, payload: Any, decode: Callable[[bytes], Any] = orjson.loads) -> Any:
+    """
+    POST a JSON payload and decode the JSON response, both via orjson by default
+
+    Raises:
+        httpx.HTTPError on transport errors or non-2xx status
+    """
+    return await send_json(
+        http_client.build_request("POST", url, content=orjson.dumps(payload), headers=JSON_HEADERS),
+        decode
+    )
+
+def static_request(url: str, method: str) -> httpx.Request:
+    """Return the reusable request for a parameterless RPC method, building it on first use"""
+    request = _static_requests.get((url, method))
+    if request is None:
+        request = http_client.build_request(
+            "POST", url,
+            content=orjson.dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": []}),
+            headers=JSON_HEADERS
+        )
+        _static_requests[(url, method)] = request
+    return request
+
+async def rpc_call(url: str, method: str, params: Optional[List] = None,
+                   decode: Callable[[bytes], Any] = orjson.loads, keep_errors: bool = False) -> Dict[str, Any]:
     """
     Make an async RPC call with error handling
 
@@ -117,20 +295,25 @@ async def rpc_call(url: str, method: str, params: Optional[List] = None) -> Dict
         url: RPC endpoint URL
         method: RPC method name
         params: Optional method parameters
+        decode: Response body decoder, returning the JSON-RPC response as a dict
+        keep_errors: Return JSON-RPC error responses to the caller instead of
+            logging them and returning an empty dict
 
     Returns:
         RPC response dict, or empty dict on error
     """
     try:
-        response = await http_client.post(
-            url,
-            json={"jsonrpc": "2.0", "id": 1, "method": method, "params": params or []}
-        )
-        response.raise_for_status()
-        data = response.json()
+        if params is None and method in STATIC_METHODS:
+            data = await send_json(static_request(url, method))
+        else:
+            data = await post_json(
+                url,
+                {"jsonrpc": "2.0", "id": 1, "method": method, "params": params or []},
+                decode
+            )
 
         # Check for RPC errors
-        if "error" in data:
+        if "error" in data and not keep_errors:
             logger.error(f"RPC error for {method}: {data['error']}")
             return {}
 
@@ -145,99 +328,361 @@ async def rpc_call(url: str, method: str, params: Optional[List] = None) -> Dict
         logger.error(f"Unexpected error calling {method}: {e}")
         return {}
 
+async def rpc_batch(url: str, calls: List[Tuple[str, str, Optional[List]]],
+                    raise_errors: bool = False) -> Dict[str, Dict[str, Any]]:
+    """
+    Make several RPC calls to the same endpoint in one JSON-RPC batch request
+
+    Falls back to concurrent single calls if the endpoint rejects batches.
+
+    Args:
+        url: RPC endpoint URL
+        calls: (name, method, params) tuples
+        raise_errors: Raise when the batch as a whole fails (transport error,
+            non-2xx status, or every fallback call failing) instead of
+            returning empty responses, so callers can tell a failure apart
+
+    Returns:
+        Dict mapping each call name to its RPC response dict (empty on error)
+    """
+    if not calls:
+        return {}
+
+    batch = [
+        {"jsonrpc": "2.0", "id": i, "method": method, "params": params or []}
+        for i, (_, method, params) in enumerate(calls)
+    ]
+    try:
+        data = await post_json(url, batch)
+    except httpx.TimeoutException:
+        logger.warning(f"Timeout calling batch of {len(calls)} methods on {url}")
+        if raise_errors:
+            raise
+        return {name: {} for name, _, _ in calls}
+    except httpx.HTTPError as e:
+        logger.error(f"HTTP error calling batch of {len(calls)} methods: {e}")
+        if raise_errors:
+            raise
+        return {name: {} for name, _, _ in calls}
+    except Exception as e:
+        logger.error(f"Unexpected error calling batch of {len(calls)} methods: {e}")
+        if raise_errors:
+            raise
+        return {name: {} for name, _, _ in calls}
+
+    if not isinstance(data, list):
+        # Some providers disable batching and answer with a single error object
+        logger.warning(f"RPC batch rejected by {url}, falling back to single calls")
+        responses = await asyncio.gather(*[rpc_call(url, method, params) for _, method, params in calls])
+        if raise_errors and not any(responses):
+            raise RuntimeError(f"Every call of the batch failed on {url}")
+        return {name: response for (name, _, _), response in zip(calls, responses)}
+
+    # Responses may arrive in any order; match them back by id
+    by_id = {item.get("id"): item for item in data if isinstance(item, dict)}
+    results = {}
+    for i, (name, method, _) in enumerate(calls):
+        item = by_id.get(i, {})
+        if "error" in item:
+            logger.error(f"RPC error for {method}: {item['error']}")
+            item = {}
+        results[name] = item
+    return results
+
+async def hedged(call: Callable[[str], Awaitable[Any]]) -> Any:
+    """
+    Run `call` against the main RPC, hedging to SOLANA_RPC_HEDGE_URL if it's slow
+
+    If the main RPC hasn't answered after SOLANA_RPC_HEDGE_DELAY_MS (or has
+    already failed), the same call is started against the backup. The first
+    attempt to succeed wins and the other is cancelled; failures only surface
+    once both attempts have failed. Without a backup URL this is just
+    call(RPC_URL).
+
+    Args:
+        call: Coroutine function taking the RPC URL to send to; it must raise
+            on failure (e.g. rpc_batch with raise_errors=True)
+
+    Returns:
+        Result of the first call to succeed
+
+    Raises:
+        The last attempt's exception if every attempt failed
+    """
+    primary = asyncio.ensure_future(call(Config.RPC_URL))
+    if not Config.HEDGE_URL:
+        return await primary
+
+    attempts = {primary}
+    hedge_started = False
+    error: Optional[BaseException] = None
+    try:
+        while True:
+            done, _ = await asyncio.wait(
+                attempts,
+                timeout=None if hedge_started else Config.HEDGE_DELAY,
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            for attempt in done:
+                attempts.discard(attempt)
+                if attempt.exception() is None:
+                    return attempt.result()
+                error = attempt.exception()
+
+            # Main RPC slow or failed: bring in the backup
+            if not hedge_started:
+                attempts.add(asyncio.ensure_future(call(Config.HEDGE_URL)))
+                hedge_started = True
+            elif not attempts:
+                raise error
+    finally:
+        # Drop the loser (or both, if we were cancelled ourselves)
+        for attempt in attempts:
+            attempt.cancel()
+
 def extract_result(response: Dict[str, Any]) -> Any:
     """Extract result from RPC response"""
     if isinstance(response, dict) and "result" in response:
         return response["result"]
     return None
 
+def extract_balances(multi_balances: Optional[Dict[str, Any]]) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Split a getMultipleAccounts result into identity and vote lamports
+
+    Accounts are returned in request order (identity first, if configured).
+    Unconfigured keys or a failed call yield None; accounts that don't
+    exist on chain yield 0, matching getBalance.
+    """
+    if not multi_balances or multi_balances.get("value") is None:
+        return None, None
+
+    accounts = iter(multi_balances["value"])
+    lamports = []
+    for key in (Config.IDENTITY_KEY, Config.VOTE_KEY):
+        account = next(accounts, None) if key else None
+        lamports.append((account or {}).get("lamports", 0) if key else None)
+    return lamports[0], lamports[1]
+
+# Last SOL price fetched (ts = monotonic time of the attempt, successful or not)
+_sol_price_cache: Dict[str, Any] = {"value": None, "ts": 0.0}
+_sol_price_lock: Optional[asyncio.Lock] = None  # Created in startup_event
+
 async def fetch_sol_price() -> Optional[float]:
-    """Fetch current SOL/USD price from CoinGecko"""
-    try:
-        response = await http_client.get(Config.COINGECKO_URL)
-        response.raise_for_status()
-        data = response.json()
-        return data.get("solana", {}).get("usd")
-    except Exception as e:
-        logger.warning(f"Failed to fetch SOL price: {e}")
-        return None
+    """Fetch current SOL/USD price from CoinGecko, cached for SOLANA_PRICE_TTL seconds"""
+    async with _sol_price_lock:
+        # Concurrent callers wait here and reuse the price the first one fetched
+        if _sol_price_cache["ts"] and time.monotonic() - _sol_price_cache["ts"] < Config.PRICE_TTL:
+            return _sol_price_cache["value"]
+
+        try:
+            response = await http_client.get(Config.COINGECKO_URL)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            price = data.get("solana", {}).get("usd")
+        except Exception as e:
+            logger.warning(f"Failed to fetch SOL price: {e}")
+            price = None
+
+        # Failures are cached too, so a rate-limited API is not retried on every refresh
+        _sol_price_cache["value"] = price
+        _sol_price_cache["ts"] = time.monotonic()
+        return price
+
+# Group 1 = Jito, group 2 = Firedancer; anything else is Agave
+_CLIENT_RE = re.compile(r"(jito)|(firedancer|fd_)", re.IGNORECASE)
 
 def detect_client_type(version_str: str) -> str:
     """Detect validator client type from version string"""
-    version_lower = version_str.lower()
-    if "jito" in version_lower:
-        return "Jito"
-    elif "firedancer" in version_lower or "fd_" in version_lower:
-        return "Firedancer"
-    else:
+    match = _CLIENT_RE.search(version_str)
+    if match is None:
         return "Agave"
+    return "Jito" if match.group(1) else "Firedancer"
 
 # ------------------------
 # BLOCK PRODUCTION DATA
 # ------------------------
+# Leader schedule for IDENTITY_KEY; immutable within an epoch, so cached until it rolls over
+_leader_schedule_cache: Dict[str, Any] = {"epoch": None, "schedule": None}
+
+def cached_leader_schedule(epoch: Optional[int]) -> Optional[Dict[str, List[int]]]:
+    """Return our leader schedule for `epoch` from the cache, or None if it is not cached"""
+    if epoch is None or epoch != _leader_schedule_cache["epoch"]:
+        return None
+    return _leader_schedule_cache["schedule"]
+
+async def get_leader_schedule(epoch_info: Optional[Dict[str, Any]],
+                              leader_schedule: Optional[Dict[str, List[int]]] = None) -> Optional[Dict[str, List[int]]]:
+    """
+    Return our leader schedule for the epoch in `epoch_info`, fetching it only on a cache miss
+
+    Args:
+        epoch_info: getEpochInfo result for the epoch wanted (the result is not
+            cached without an epoch number)
+        leader_schedule: That epoch's leader schedule, already fetched by the caller, if any
+
+    Returns:
+        Leader schedule keyed by identity, or None if it could not be fetched
+    """
+    epoch_info = epoch_info or {}
+    epoch = epoch_info.get("epoch")
+    cached = cached_leader_schedule(epoch)
+    if cached is not None:
+        return cached
+
+    if leader_schedule is None:
+        # Ask by the epoch's first slot rather than for the current epoch, so a
+        # caller holding slightly stale epoch info still gets (and caches) the
+        # schedule of the epoch it names
+        first_slot = None
+        if "absoluteSlot" in epoch_info and "slotIndex" in epoch_info:
+            first_slot = epoch_info["absoluteSlot"] - epoch_info["slotIndex"]
+        leader_schedule = extract_result(await rpc_call(
+            Config.RPC_URL,
+            "getLeaderSchedule",
+            [first_slot, {"commitment": "finalized", "identity": Config.IDENTITY_KEY}]
+        ))
+
+    if leader_schedule is not None and epoch is not None:
+        _leader_schedule_cache["epoch"] = epoch
+        _leader_schedule_cache["schedule"] = leader_schedule
+    return leader_schedule
+
+VOTE_PROGRAM_KEYS = frozenset({"Vote111111111111111111111111111111111111111"})
+
+# Shared read-only stand-in for missing objects, so lookups don't allocate a new {} per tx
+_EMPTY = MappingProxyType({})
+
+def _account_keys(tx: Dict[str, Any]) -> Sequence[str]:
+    """Account keys of a transaction (legacy or versioned message)"""
+    message = (tx.get("transaction") or _EMPTY).get("message") or _EMPTY
+    return message.get("accountKeys") or message.get("staticAccountKeys") or ()
+
+if msgspec is not None:
+    # Only the fields fetch_block_details reads; the C decoder skips everything else
+    # (logs, balances, inner instructions) without building Python objects for it
+    class _TxMeta(msgspec.Struct, omit_defaults=True):
+        fee: int = 0
+        computeUnitsConsumed: int = 0
+
+    class _TxMessage(msgspec.Struct, omit_defaults=True):
+        accountKeys: List[str] = []
+        staticAccountKeys: List[str] = []
+
+    class _Transaction(msgspec.Struct, omit_defaults=True):
+        message: Optional[_TxMessage] = None
+
+    class _BlockTransaction(msgspec.Struct, omit_defaults=True):
+        meta: Optional[_TxMeta] = None
+        transaction: Optional[_Transaction] = None
+
+    class _Block(msgspec.Struct, omit_defaults=True):
+        blockhash: Optional[str] = None
+        transactions: List[_BlockTransaction] = []
+
+    class _BlockResponse(msgspec.Struct, omit_defaults=True):
+        result: Optional[_Block] = None
+        error: Optional[Dict[str, Any]] = None
+
+    _block_decoder = msgspec.json.Decoder(_BlockResponse)
+
+    def decode_block_response(content: bytes) -> Dict[str, Any]:
+        """Decode a getBlock response into plain dicts holding only the fields we use"""
+        return msgspec.to_builtins(_block_decoder.decode(content))
+else:
+    decode_block_response = orjson.loads
+
+# Limits getBlock calls in flight across /blocks and the epoch-fee sampling
+# (created in startup_event)
+_block_sem: Optional[asyncio.Semaphore] = None
+
+# getBlock error codes that describe the slot itself rather than a failed call
+_ERROR_STATUS = {
+    -32007: "skipped",   # Slot was skipped (validator actually missed it)
+    -32009: "skipped",   # Same, reported by long-term storage
+    -32004: "no data",   # Block not available (RPC pruned the data)
+}
+
+def _error_status_from_message(message: str) -> Optional[str]:
+    """Fallback for RPC nodes that use other error codes for the same conditions"""
+    message = message.lower()
+    if "skipped" in message:
+        return "skipped"
+    if "not available" in message:
+        return "no data"
+    return None
+
+def _error_row(slot: int, status: str) -> Dict[str, Any]:
+    """/blocks row for a slot without block data (skipped, no data, error)"""
+    # Skipped slots have no values at all; the others just could not be read
+    placeholder = None if status == "skipped" else "-"
+    return {
+        "slot": slot,
+        "status": status,
+        "votes": placeholder, "non_votes": placeholder,
+        "fees_sol": placeholder, "compute_units": placeholder, "cu_percent": placeholder,
+        "explorer_url": f"https://solscan.io/block/{slot}"
+    }
+
+# Details of finalized slots, which never change (bounded; oldest evicted first)
+_block_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+BLOCK_CACHE_SIZE = 256
+
 async def fetch_block_details(slot: int) -> Optional[Dict[str, Any]]:
     """
     Fetch detailed block data for a specific slot.
     Returns dict with status: "produced", "skipped", or "unavailable"
+
+    Produced and skipped slots are final, so they are served from _block_cache
+    once seen.
     """
+    cached = _block_cache.get(slot)
+    if cached is not None:
+        return cached
+
+    details = await _fetch_block_details(slot)
+    if details and details["status"] in ("produced", "skipped"):
+        _block_cache[slot] = details
+        if len(_block_cache) > BLOCK_CACHE_SIZE:
+            _block_cache.popitem(last=False)
+    return details
+
+async def _fetch_block_details(slot: int) -> Optional[Dict[str, Any]]:
+    """Fetch and summarize one block from the RPC (uncached)"""
     try:
-        response = await rpc_call(
-            Config.RPC_URL,
-            "getBlock",
-            [slot, {"encoding": "json", "transactionDetails": "full", "rewards": True, "maxSupportedTransactionVersion": 0}]
-        )
-
-        # Check for RPC errors
+        async with _block_sem:
+            response = await rpc_call(
+                Config.RPC_URL,
+                "getBlock",
+                [slot, {"encoding": "json", "transactionDetails": "full", "rewards": True, "maxSupportedTransactionVersion": 0}],
+                decode_block_response,
+                keep_errors=True
+            )
+
+        # Skipped and pruned slots come back as RPC errors
         if "error" in response:
             error_code = response["error"].get("code", 0)
             error_msg = response["error"].get("message", "")
 
-            # -32009: Slot was skipped (validator actually missed it)
-            if error_code == -32009 or "skipped" in error_msg.lower():
-                return {
-                    "slot": slot,
-                    "status": "skipped",
-                    "votes": None, "non_votes": None,
-                    "fees_sol": None, "compute_units": None, "cu_percent": None,
-                    "explorer_url": f"https://solscan.io/block/{slot}"
-                }
-            # -32004: Block not available (RPC pruned the data)
-            elif error_code == -32004 or "not available" in error_msg.lower():
-                return {
-                    "slot": slot,
-                    "status": "no data",
-                    "votes": "-", "non_votes": "-",
-                    "fees_sol": "-", "compute_units": "-", "cu_percent": "-",
-                    "explorer_url": f"https://solscan.io/block/{slot}"
-                }
-            else:
-                logger.warning(f"RPC error for slot {slot}: {error_msg}")
-                return None
+            status = _ERROR_STATUS.get(error_code) or _error_status_from_message(error_msg)
+            if status:
+                return _error_row(slot, status)
+
+            logger.warning(f"RPC error for slot {slot}: {error_msg}")
+            return None
 
         block = extract_result(response)
         if not block:
             return None
 
         transactions = block.get("transactions", [])
-        votes = 0
-        non_votes = 0
-        total_fees = 0
-        total_cu = 0
-
-        VOTE_PROGRAM = "Vote111111111111111111111111111111111111111"
-
-        for tx in transactions:
-            meta = tx.get("meta", {})
-            total_fees += meta.get("fee", 0)
-            total_cu += meta.get("computeUnitsConsumed", 0)
+        metas = [tx.get("meta") or _EMPTY for tx in transactions]
+        total_fees = sum(meta.get("fee", 0) for meta in metas)
+        total_cu = sum(meta.get("computeUnitsConsumed", 0) for meta in metas)
 
-            message = tx.get("transaction", {}).get("message", {})
-            account_keys = message.get("accountKeys", []) or message.get("staticAccountKeys", [])
-
-            if VOTE_PROGRAM in account_keys:
-                votes += 1
-            else:
-                non_votes += 1
+        is_non_vote = VOTE_PROGRAM_KEYS.isdisjoint
+        votes = sum(1 for tx in transactions if not is_non_vote(_account_keys(tx)))
+        non_votes = len(transactions) - votes
 
         return {
             "slot": slot,
@@ -253,24 +698,27 @@ async def fetch_block_details(slot: int) -> Optional[Dict[str, Any]]:
         logger.warning(f"Failed to fetch block {slot}: {e}")
         return None
 
-async def fetch_leader_slots_data() -> Dict[str, Any]:
+async def fetch_leader_slots_data(epoch_info: Optional[Dict[str, Any]] = None,
+                                  leader_schedule: Optional[Dict[str, List[int]]] = None) -> Dict[str, Any]:
     """
     Fetch last 4 completed slots and next 4 upcoming slots with countdown.
     Returns data for Grafana Infinity plugin table.
+
+    Args:
+        epoch_info: getEpochInfo result already fetched by the caller, if any
+        leader_schedule: This epoch's leader schedule for our identity, if already known
     """
     if not Config.IDENTITY_KEY:
         return {"error": "IDENTITY_KEY not configured", "slots": []}
 
-    # Fetch current slot, epoch info, and leader schedule
-    current_slot_resp, epoch_resp, leader_schedule_resp = await asyncio.gather(
-        rpc_call(Config.RPC_URL, "getSlot", [{"commitment": "finalized"}]),
-        rpc_call(Config.RPC_URL, "getEpochInfo", [{"commitment": "finalized"}]),
-        rpc_call(Config.RPC_URL, "getLeaderSchedule", [None, {"commitment": "finalized", "identity": Config.IDENTITY_KEY}])
-    )
+    # Fetch epoch info; its finalized absoluteSlot is the current slot
+    if not epoch_info:
+        epoch_resp = await rpc_call(Config.RPC_URL, "getEpochInfo", [{"commitment": "finalized"}])
+        epoch_info = extract_result(epoch_resp) or {}
+    current_slot = epoch_info.get("absoluteSlot", 0)
 
-    current_slot = extract_result(current_slot_resp) or 0
-    epoch_info = extract_result(epoch_resp) or {}
-    leader_schedule = extract_result(leader_schedule_resp) or {}
+    # Leader schedule only changes per epoch; fetch it only if it is not cached
+    leader_schedule = await get_leader_schedule(epoch_info, leader_schedule) or {}
 
     our_slots = leader_schedule.get(Config.IDENTITY_KEY, [])
     if not our_slots:
@@ -298,11 +746,7 @@ async def fetch_leader_slots_data() -> Dict[str, Any]:
                 slots_data.append(result)
             else:
                 # Only None if unexpected error occurred
-                slots_data.append({
-                    "slot": slot, "status": "error", "votes": "-", "non_votes": "-",
-                    "fees_sol": "-", "compute_units": "-", "cu_percent": "-",
-                    "explorer_url": f"https://solscan.io/block/{slot}"
-                })
+                slots_data.append(_error_row(slot, "error"))
 
     # Add upcoming slots
     for s in upcoming:
@@ -325,27 +769,31 @@ async def fetch_leader_slots_data() -> Dict[str, Any]:
         "slots": upcoming_data + completed_data
     }
 
-async def fetch_inflation_rewards() -> Dict[str, Any]:
+async def fetch_inflation_rewards(epoch_info: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Fetch inflation rewards for the vote account.
     Returns rewards for current epoch and previous epoch.
+
+    Args:
+        epoch_info: getEpochInfo result already fetched by the caller, if any
     """
     if not Config.VOTE_KEY:
         return {"current_epoch": None, "previous_epoch": None}
 
     try:
-        # Get current epoch info first
-        epoch_resp = await rpc_call(Config.RPC_URL, "getEpochInfo", [{"commitment": "finalized"}])
-        epoch_info = extract_result(epoch_resp) or {}
+        # Get current epoch info first, unless the caller already has it
+        if not epoch_info:
+            epoch_resp = await rpc_call(Config.RPC_URL, "getEpochInfo", [{"commitment": "finalized"}])
+            epoch_info = extract_result(epoch_resp) or {}
         current_epoch = epoch_info.get("epoch", 0)
 
-        # Fetch rewards for previous epoch (current epoch rewards aren't finalized yet)
-        rewards_resp = await rpc_call(
-            Config.RPC_URL,
-            "getInflationReward",
-            [[Config.VOTE_KEY], {"epoch": current_epoch - 1}]
-        )
-        rewards = extract_result(rewards_resp)
+        # Fetch rewards for the previous epoch (current epoch rewards aren't finalized yet)
+        # and the epoch before that for comparison, both in one batch request
+        responses = await rpc_batch(Config.RPC_URL, [
+            ("last", "getInflationReward", [[Config.VOTE_KEY], {"epoch": current_epoch - 1}]),
+            ("prev", "getInflationReward", [[Config.VOTE_KEY], {"epoch": current_epoch - 2}]),
+        ])
+        rewards = extract_result(responses["last"])
 
         prev_reward = None
         if rewards and len(rewards) > 0 and rewards[0]:
@@ -359,13 +807,7 @@ async def fetch_inflation_rewards() -> Dict[str, Any]:
                 "effective_slot": reward_data.get("effectiveSlot", 0)
             }
 
-        # Also try to get epoch before that for comparison
-        rewards_resp_2 = await rpc_call(
-            Config.RPC_URL,
-            "getInflationReward",
-            [[Config.VOTE_KEY], {"epoch": current_epoch - 2}]
-        )
-        rewards_2 = extract_result(rewards_resp_2)
+        rewards_2 = extract_result(responses["prev"])
 
         prev_prev_reward = None
         if rewards_2 and len(rewards_2) > 0 and rewards_2[0]:
@@ -386,22 +828,38 @@ async def fetch_inflation_rewards() -> Dict[str, Any]:
         return {"current_epoch": None, "last_epoch_reward": None, "prev_epoch_reward": None}
 
 
-async def fetch_epoch_fees() -> Dict[str, Any]:
+async def fetch_epoch_fees(epoch_info: Optional[Dict[str, Any]] = None,
+                           block_production: Optional[Dict[str, Any]] = None,
+                           leader_schedule: Optional[Dict[str, List[int]]] = None) -> Dict[str, Any]:
     """
     Calculate total fees earned from all blocks produced this epoch.
     Uses getBlockProduction to get slot range, then fetches block data.
+
+    Args:
+        epoch_info: getEpochInfo result already fetched by the caller, if any
+        block_production: getBlockProduction result already fetched by the caller, if any
+        leader_schedule: This epoch's leader schedule for our identity, if already known
     """
     if not Config.IDENTITY_KEY:
         return {"total_fees_sol": 0, "blocks_with_fees": 0}
 
     try:
-        # Get block production data with slot range
-        block_prod_resp = await rpc_call(
-            Config.RPC_URL,
-            "getBlockProduction",
-            [{"commitment": "finalized", "identity": Config.IDENTITY_KEY}]
-        )
-        block_prod = extract_result(block_prod_resp)
+        # Fetch whichever of block production and epoch info the caller didn't
+        # pass in one batch request, rather than one round trip after the other
+        missing = []
+        if block_production is None:
+            missing.append(("block_production", "getBlockProduction",
+                            [{"commitment": "finalized", "identity": Config.IDENTITY_KEY}]))
+        if not epoch_info:
+            missing.append(("epoch_info", "getEpochInfo", [{"commitment": "finalized"}]))
+        responses = await rpc_batch(Config.RPC_URL, missing)
+
+        # Block production data with slot range
+        block_prod = block_production
+        if block_prod is None:
+            block_prod = extract_result(responses["block_production"])
+        if not epoch_info:
+            epoch_info = extract_result(responses["epoch_info"]) or {}
 
         if not block_prod or "value" not in block_prod:
             return {"total_fees_sol": 0, "blocks_with_fees": 0}
@@ -417,21 +875,12 @@ async def fetch_epoch_fees() -> Dict[str, Any]:
         first_slot = slot_range.get("firstSlot", 0)
         last_slot = slot_range.get("lastSlot", 0)
 
-        # Get our produced slots from leader schedule
-        leader_schedule_resp = await rpc_call(
-            Config.RPC_URL,
-            "getLeaderSchedule",
-            [None, {"commitment": "finalized", "identity": Config.IDENTITY_KEY}]
-        )
-        leader_schedule = extract_result(leader_schedule_resp) or {}
+        # Get our produced slots from leader schedule (cached per epoch)
+        leader_schedule = await get_leader_schedule(epoch_info, leader_schedule) or {}
         our_slot_offsets = leader_schedule.get(Config.IDENTITY_KEY, [])
 
         if not our_slot_offsets:
             return {"total_fees_sol": 0, "blocks_with_fees": 0}
-
-        # Get epoch info to calculate absolute slots
-        epoch_resp = await rpc_call(Config.RPC_URL, "getEpochInfo", [{"commitment": "finalized"}])
-        epoch_info = extract_result(epoch_resp) or {}
         epoch_start_slot = epoch_info.get("absoluteSlot", 0) - epoch_info.get("slotIndex", 0)
         current_slot = epoch_info.get("absoluteSlot", 0)
 
@@ -448,19 +897,22 @@ async def fetch_epoch_fees() -> Dict[str, Any]:
         # Fetch fees from produced blocks (sample last 5 to avoid rate limits)
         sample_slots = slots_to_check[-5:] if len(slots_to_check) > 5 else slots_to_check
 
-        total_fees = 0
-        blocks_with_fees = 0
-
         async def get_block_fees(slot):
             try:
-                resp = await rpc_call(
-                    Config.RPC_URL,
-                    "getBlock",
-                    [slot, {"encoding": "json", "transactionDetails": "full", "rewards": False, "maxSupportedTransactionVersion": 0}]
-                )
+                # Fee rewards credited to the leader; skipping transactions keeps the response tiny
+                async with _block_sem:
+                    resp = await rpc_call(
+                        Config.RPC_URL,
+                        "getBlock",
+                        [slot, {"transactionDetails": "none", "rewards": True, "maxSupportedTransactionVersion": 0}]
+                    )
                 block = extract_result(resp)
                 if block:
-                    fees = sum(tx.get("meta", {}).get("fee", 0) for tx in block.get("transactions", []))
+                    fees = sum(
+                        reward.get("lamports", 0)
+                        for reward in block.get("rewards") or []
+                        if reward.get("rewardType") == "Fee"
+                    )
                     return fees
                 return 0
             except:
@@ -468,11 +920,7 @@ async def fetch_epoch_fees() -> Dict[str, Any]:
 
         # Fetch fees concurrently
         fee_results = await asyncio.gather(*[get_block_fees(s) for s in sample_slots])
-
-        for fees in fee_results:
-            if fees > 0:
-                total_fees += fees
-                blocks_with_fees += 1
+        total_fees = sum(fee_results)
 
         # Extrapolate to full epoch if we sampled
         total_completed = len(our_completed_slots)
@@ -498,83 +946,334 @@ async def fetch_epoch_fees() -> Dict[str, Any]:
 # ------------------------
 # METRICS COLLECTION
 # ------------------------
-async def fetch_all_metrics() -> Dict[str, Any]:
+async def fetch_epoch_metrics(epoch_info: Optional[Dict[str, Any]] = None,
+                              leader_schedule: Optional[Dict[str, List[int]]] = None) -> Dict[str, Any]:
     """
-    Fetch all metrics concurrently using async/await
+    Fetch data that only changes at epoch boundaries
+
+    Args:
+        epoch_info: getEpochInfo result (defaults to the last one seen in _state)
+        leader_schedule: Leader schedule fetched alongside epoch_info, if any
 
     Returns:
-        Dictionary containing all metric data
+        Dictionary with the leader slot count and the epoch it was counted for
+        (empty if unknown)
     """
-    rpc_url = Config.RPC_URL
-    local_rpc_url = Config.LOCAL_RPC_URL
+    if not Config.IDENTITY_KEY:
+        return {}
 
-    # Prepare RPC calls
-    rpc_calls = []
-    call_names = []
+    if not epoch_info:
+        epoch_info = _state.get("epoch_info") or {}
+    epoch = epoch_info.get("epoch")
+    if epoch is None:
+        return {}
 
-    # Local health check (if local RPC available)
-    if local_rpc_url:
-        rpc_calls.append(rpc_call(local_rpc_url, "getHealth"))
-        call_names.append("health")
-
-    # Cluster-wide calls (always via main RPC)
-    rpc_calls.extend([
-        rpc_call(rpc_url, "getVersion"),
-        rpc_call(rpc_url, "getEpochInfo", [{"commitment": "finalized"}]),
-        rpc_call(rpc_url, "getSlot", [{"commitment": "finalized"}]),
-        rpc_call(rpc_url, "getRecentPerformanceSamples", [5]),
-    ])
-    call_names.extend(["version", "epoch_info", "slot", "performance"])
-
-    # Validator-specific calls (only if keys are configured)
-    if Config.IDENTITY_KEY:
-        rpc_calls.extend([
-            rpc_call(rpc_url, "getBalance", [Config.IDENTITY_KEY, {"commitment": "finalized"}]),
-            rpc_call(rpc_url, "getLeaderSchedule", [None, {"commitment": "finalized", "identity": Config.IDENTITY_KEY}]),
-        ])
-        call_names.extend(["identity_balance", "leader_schedule"])
+    leader_schedule = await get_leader_schedule(epoch_info, leader_schedule)
+    if leader_schedule is None:
+        return {}
+    return {
+        "leader_slots_assigned": len(leader_schedule.get(Config.IDENTITY_KEY, [])),
+        "leader_slots_epoch": epoch,
+    }
+
+def fast_rpc_calls() -> List[Tuple[str, str, Optional[List]]]:
+    """RPC calls for data that changes every few slots, as (name, method, params)"""
+    calls = [
+        ("epoch_info", "getEpochInfo", [{"commitment": "finalized"}]),
+        ("performance", "getRecentPerformanceSamples", [5]),
+    ]
 
+    # Vote account carries delinquency and last vote as well as stake/commission
     if Config.VOTE_KEY:
-        rpc_calls.extend([
-            rpc_call(rpc_url, "getBalance", [Config.VOTE_KEY, {"commitment": "finalized"}]),
-            rpc_call(rpc_url, "getVoteAccounts", [{"commitment": "finalized", "votePubkey": Config.VOTE_KEY}]),
-        ])
-        call_names.extend(["vote_balance", "vote_accounts"])
+        calls.append(
+            ("vote_accounts", "getVoteAccounts", [{"commitment": "finalized", "votePubkey": Config.VOTE_KEY}])
+        )
+
+    return calls
+
+def slow_rpc_calls() -> List[Tuple[str, str, Optional[List]]]:
+    """RPC calls for data that changes over minutes or longer, as (name, method, params)"""
+    calls = [("version", "getVersion", None)]
+
+    balance_keys = [key for key in (Config.IDENTITY_KEY, Config.VOTE_KEY) if key]
+    if balance_keys:
+        # Identity and vote balances in one call; dataSlice drops the account data
+        calls.append(
+            ("multi_balances", "getMultipleAccounts", [balance_keys, {
+                "commitment": "finalized",
+                "encoding": "base64",
+                "dataSlice": {"offset": 0, "length": 0}
+            }])
+        )
 
     # Block production for skip rate (only if identity key set)
     if Config.IDENTITY_KEY:
-        rpc_calls.append(
-            rpc_call(rpc_url, "getBlockProduction", [{"commitment": "finalized", "identity": Config.IDENTITY_KEY}])
+        calls.append(
+            ("block_production", "getBlockProduction", [{"commitment": "finalized", "identity": Config.IDENTITY_KEY}])
         )
-        call_names.append("block_production")
 
-    # Execute all RPC calls + SOL price fetch + inflation rewards + epoch fees concurrently
-    rpc_calls.append(fetch_sol_price())
-    call_names.append("sol_price")
+    return calls
+
+def fast_tasks() -> Dict[str, Awaitable]:
+    """Non-batched fetches refreshed with the fast tier"""
+    tasks: Dict[str, Awaitable] = {}
+
+    # Local health check (if local RPC available)
+    if Config.LOCAL_RPC_URL:
+        tasks["health"] = rpc_call(Config.LOCAL_RPC_URL, "getHealth")
+
+    return tasks
+
+def slow_tasks() -> Dict[str, Awaitable]:
+    """Non-batched fetches refreshed with the slow tier"""
+    return {"sol_price": fetch_sol_price()}
+
+def slow_followups() -> Dict[str, Callable[[Dict[str, Any]], Awaitable]]:
+    """
+    Slow-tier fetches that reuse epoch info, block production and the leader
+    schedule from the batch (or the last snapshot) instead of refetching them
+    """
+    def epoch_fees(context: Dict[str, Any]) -> Awaitable:
+        epoch_info = context.get("epoch_info")
+        return fetch_epoch_fees(epoch_info, context.get("block_production"), context.get("leader_schedule"))
+
+    return {
+        "inflation_rewards": lambda context: fetch_inflation_rewards(context.get("epoch_info")),
+        "epoch_fees": epoch_fees,
+    }
+
+# Values that must disappear as soon as their fetch times out: a kept health
+# value would hide a hanging node from absent()/staleness alerts
+NEVER_KEEP = frozenset({"health"})
+
+# Consecutive timed-out refreshes per value name, reset once it is fetched again
+_timeouts: Dict[str, int] = {}
 
-    rpc_calls.append(fetch_inflation_rewards())
-    call_names.append("inflation_rewards")
+def leader_slots_followup(context: Dict[str, Any]) -> Awaitable:
+    """Build the /blocks table from the batch's epoch info and leader schedule"""
+    return fetch_leader_slots_data(context.get("epoch_info"), context.get("leader_schedule"))
 
-    rpc_calls.append(fetch_epoch_fees())
-    call_names.append("epoch_fees")
+async def collect_metrics(main_calls: List[Tuple[str, str, Optional[List]]],
+                          tasks: Dict[str, Awaitable], tier: str,
+                          followups: Optional[Dict[str, Callable[[Dict[str, Any]], Awaitable]]] = None) -> Dict[str, Any]:
+    """
+    Run one batch of RPC calls and the extra fetches concurrently
+
+    Fetches still running after 90% of SOLANA_RPC_TIMEOUT are cancelled and
+    left out of the result, so the snapshot keeps their previous values
+    instead of one slow method holding up the whole refresh. Kept values
+    expire (are set to None) after SOLANA_MAX_STALE_REFRESHES consecutive
+    timeouts; health is dropped on the first.
 
-    results = await asyncio.gather(*rpc_calls, return_exceptions=True)
+    Args:
+        main_calls: RPC calls as (name, method, params), sent as one (hedged) batch request
+        tasks: Other awaitables by name (health, SOL price)
+        tier: Refresh tier name, used as the partial-scrape gauge label
+        followups: Fetches by name that start once the batch returns; each is
+            called with the batch results layered over the last snapshot
+
+    Returns:
+        Dictionary containing the collected metric data
+    """
+    futures = {"main_rpc": asyncio.ensure_future(hedged(lambda url: rpc_batch(url, main_calls, raise_errors=True)))}
+    futures.update((name, asyncio.ensure_future(task)) for name, task in tasks.items())
+
+    async def after_batch(fetch: Callable[[Dict[str, Any]], Awaitable]) -> Any:
+        responses = await asyncio.shield(futures["main_rpc"])
+        context = dict(_state)
+        context.update((call_name, extract_result(response)) for call_name, response in responses.items())
+        return await fetch(context)
+
+    futures.update((name, asyncio.ensure_future(after_batch(fetch))) for name, fetch in (followups or {}).items())
+
+    _, pending = await asyncio.wait(futures.values(), timeout=Config.TIMEOUT * 0.9)
+    for future in pending:
+        future.cancel()
+    PARTIAL_SCRAPE.labels(tier=tier).set(1 if pending else 0)
+    _tier_partial[tier] = bool(pending)
 
     # Map results to names
     metrics = {}
-    for name, result in zip(call_names, results):
+    for name, future in futures.items():
+        keys = [call_name for call_name, _, _ in main_calls] if name == "main_rpc" else [name]
+        if future in pending:
+            expired = []
+            for key in keys:
+                _timeouts[key] = _timeouts.get(key, 0) + 1
+                if key in NEVER_KEEP or _timeouts[key] > Config.MAX_STALE_REFRESHES:
+                    metrics[key] = None
+                    expired.append(key)
+            if expired:
+                logger.warning(f"Timed out fetching {name}; dropping {', '.join(expired)}")
+            else:
+                logger.warning(f"Timed out fetching {name}; keeping previous values")
+            continue
+        for key in keys:
+            _timeouts.pop(key, None)
+
+        result = future.exception() or future.result()
         if isinstance(result, Exception):
             logger.error(f"Exception fetching {name}: {result}")
-            metrics[name] = None
-        elif name in ("sol_price", "inflation_rewards", "epoch_fees"):
+            result = {call_name: {} for call_name, _, _ in main_calls} if name == "main_rpc" else None
+
+        if name == "main_rpc":
+            for call_name, response in result.items():
+                metrics[call_name] = extract_result(response)
+        elif name == "health":
+            metrics[name] = extract_result(result)
+        else:
             # These return values directly, not RPC responses
             metrics[name] = result
-        else:
-            metrics[name] = extract_result(result)
 
     return metrics
 
-def format_prometheus_metrics(data: Dict[str, Any]) -> str:
+async def fetch_fast_metrics() -> Dict[str, Any]:
+    """Fetch the fast tier: epoch progress, performance, vote account, health"""
+    return await collect_metrics(fast_rpc_calls(), fast_tasks(), "fast")
+
+async def fetch_slow_metrics() -> Dict[str, Any]:
+    """Fetch the slow tier: version, balances, block production, price, rewards, fees"""
+    return await collect_metrics(slow_rpc_calls(), slow_tasks(), "slow", slow_followups())
+
+async def fetch_all_metrics() -> Dict[str, Any]:
+    """
+    Fetch all metrics concurrently using async/await
+
+    Returns:
+        Dictionary containing all metric data
+    """
+    main_calls = fast_rpc_calls() + slow_rpc_calls()
+
+    # Leader schedule only changes per epoch; fetch it once to seed the cache
+    # (same batch as getEpochInfo, so it belongs to the epoch that call reports)
+    if Config.IDENTITY_KEY and _leader_schedule_cache["epoch"] is None:
+        main_calls.append(
+            ("leader_schedule", "getLeaderSchedule", [None, {"commitment": "finalized", "identity": Config.IDENTITY_KEY}])
+        )
+
+    # The /blocks table overlaps with the other fetches and is served from the snapshot
+    followups = slow_followups()
+    if Config.IDENTITY_KEY:
+        followups["leader_slots_table"] = leader_slots_followup
+
+    metrics = await collect_metrics(main_calls, {**fast_tasks(), **slow_tasks()}, "all", followups)
+
+    metrics.update(await fetch_epoch_metrics(metrics.get("epoch_info"), metrics.pop("leader_schedule", None)))
+
+    return metrics
+
+# ------------------------
+# METRIC DEFINITIONS
+# ------------------------
+# Help text for every exported gauge
+METRIC_HELP: Dict[str, str] = {
+    "solana_node_health": "Node health status (1=healthy, 0=down)",
+    "solana_node_version_info": "Solana version info (one series, for the running version only)",
+    "solana_node_client_info": "Validator client type (one series: Agave, Jito or Firedancer)",
+    "solana_epoch_number": "Current epoch number",
+    "solana_epoch_slot_index": "Current slot within epoch",
+    "solana_epoch_slots_total": "Total slots in current epoch",
+    "solana_slot_height": "Current absolute slot",
+    "solana_block_height": "Current block height",
+    "solana_transactions_total": "Total transactions since genesis",
+    "solana_epoch_progress_ratio": "Epoch completion ratio (0-1)",
+    "solana_epoch_progress_percent": "Epoch completion percentage",
+    "solana_cluster_slot": "Latest cluster slot",
+    "solana_network_tps": "Network transactions per second (last 5 minutes)",
+    "solana_network_slot_time_ms": "Average time per slot in milliseconds (last 5 minutes)",
+    "solana_validator_identity_balance_sol": "Validator identity account balance (SOL)",
+    "solana_validator_vote_balance_sol": "Validator vote account balance (SOL)",
+    "solana_validator_activated_stake_sol": "Active stake delegated to validator (SOL)",
+    "solana_validator_last_vote_slot": "Last voted slot",
+    "solana_validator_root_slot": "Root slot",
+    "solana_validator_commission_percent": "Validator commission percentage",
+    "solana_validator_delinquent": "Validator delinquency status (0=active, 1=delinquent)",
+    "solana_validator_leader_slots_assigned": "Number of leader slots assigned this epoch",
+    "solana_validator_leader_slots_total": "Total leader slots",
+    "solana_validator_blocks_produced": "Blocks successfully produced",
+    "solana_validator_blocks_skipped": "Blocks skipped (missed)",
+    "solana_validator_skip_rate_percent": "Skip rate percentage",
+    "solana_sol_price_usd": "Current SOL price in USD",
+    "solana_validator_identity_balance_usd": "Identity account balance in USD",
+    "solana_validator_vote_balance_usd": "Vote account balance in USD",
+    "solana_validator_activated_stake_usd": "Active stake in USD",
+    "solana_validator_current_epoch": "Current epoch number",
+    "solana_validator_last_epoch_reward_sol": "Inflation reward earned last epoch (SOL)",
+    "solana_validator_last_epoch_reward_epoch": "Epoch number for last reward",
+    "solana_validator_last_epoch_reward_usd": "Inflation reward earned last epoch (USD)",
+    "solana_validator_prev_epoch_reward_sol": "Inflation reward earned 2 epochs ago (SOL)",
+    "solana_validator_epoch_fees_total_sol": "Estimated total transaction fees earned this epoch (SOL)",
+    "solana_validator_avg_fee_per_block_sol": "Average transaction fee per block (SOL)",
+    "solana_validator_blocks_completed_epoch": "Number of blocks completed this epoch",
+    "solana_validator_epoch_fees_total_usd": "Estimated total transaction fees earned this epoch (USD)",
+    "solana_exporter_build_info": "Exporter version info",
+    "solana_exporter_scrape_duration_seconds": "Time spent on the last refresh of a tier",
+    "solana_exporter_scrape_timestamp_seconds": "Unix timestamp of the last refresh of a tier",
+    "solana_exporter_snapshot_age_seconds": "Seconds since a tier's metrics were collected",
+    "solana_exporter_partial_scrape": "1 if the last refresh of a tier timed out and kept some previous values",
+    "solana_exporter_cache_hit": "1 if this scrape was served from the cached snapshot, 0 if it waited on a refresh",
+}
+
+# Label names of the labeled metrics; add_metric takes their values positionally.
+# Each snapshot carries only the current version/client, so an upgrade replaces
+# the series instead of leaving the old one exported next to it.
+METRIC_LABELS: Dict[str, List[str]] = {
+    "solana_node_version_info": ["version"],
+    "solana_node_client_info": ["client"],
+    "solana_exporter_build_info": ["version", "python"],
+}
+
+# Build info never changes, so its family is built once and reused by every render
+BUILD_INFO = GaugeMetricFamily("solana_exporter_build_info", METRIC_HELP["solana_exporter_build_info"],
+                               labels=METRIC_LABELS["solana_exporter_build_info"])
+BUILD_INFO.add_metric(["1.0.0", "3.8+"], 1)
+
+class SnapshotCollector:
+    """Exposes the metric families built by the latest refresh"""
+
+    def __init__(self):
+        self.families: List[GaugeMetricFamily] = []
+
+    def collect(self):
+        return list(self.families)
+
+# Registry for the collected metrics, rendered when the data changes
+REGISTRY = CollectorRegistry(auto_describe=False)
+SNAPSHOT = SnapshotCollector()
+REGISTRY.register(SNAPSHOT)
+
+# Exporter metadata, rendered on every request and appended to the snapshot
+META_REGISTRY = CollectorRegistry(auto_describe=False)
+# Per refresh tier, so a stalled tier isn't masked by the others
+SCRAPE_DURATION = Gauge("solana_exporter_scrape_duration_seconds",
+                        METRIC_HELP["solana_exporter_scrape_duration_seconds"], ["tier"], registry=META_REGISTRY)
+SCRAPE_TIMESTAMP = Gauge("solana_exporter_scrape_timestamp_seconds",
+                         METRIC_HELP["solana_exporter_scrape_timestamp_seconds"], ["tier"], registry=META_REGISTRY)
+SNAPSHOT_AGE = Gauge("solana_exporter_snapshot_age_seconds",
+                     METRIC_HELP["solana_exporter_snapshot_age_seconds"], ["tier"], registry=META_REGISTRY)
+CACHE_HIT = Gauge("solana_exporter_cache_hit",
+                  METRIC_HELP["solana_exporter_cache_hit"], registry=META_REGISTRY)
+PARTIAL_SCRAPE = Gauge("solana_exporter_partial_scrape",
+                       METRIC_HELP["solana_exporter_partial_scrape"], ["tier"], registry=META_REGISTRY)
+
+# Gauges that are a straight copy of one RPC field, emitted in a single pass
+EPOCH_INFO_GAUGES: Tuple[Tuple[str, str], ...] = (
+    ("solana_epoch_number", "epoch"),
+    ("solana_epoch_slot_index", "slotIndex"),
+    ("solana_epoch_slots_total", "slotsInEpoch"),
+    ("solana_slot_height", "absoluteSlot"),
+    # Cluster slot (for comparison with local validator); same as getSlot at finalized
+    ("solana_cluster_slot", "absoluteSlot"),
+    ("solana_block_height", "blockHeight"),
+    ("solana_transactions_total", "transactionCount"),
+)
+VOTE_ACCOUNT_GAUGES: Tuple[Tuple[str, str], ...] = (
+    ("solana_validator_last_vote_slot", "lastVote"),
+    ("solana_validator_root_slot", "rootSlot"),
+    ("solana_validator_commission_percent", "commission"),
+)
+
+def format_prometheus_metrics(data: Dict[str, Any]) -> bytes:
     """
     Format metrics data into Prometheus text format
 
@@ -582,57 +1281,53 @@ def format_prometheus_metrics(data: Dict[str, Any]) -> str:
         data: Dictionary of metric data from fetch_all_metrics()
 
     Returns:
-        Prometheus-formatted metrics string
+        Prometheus-formatted metrics body (UTF-8 bytes)
     """
-    lines = []
+    families: Dict[str, GaugeMetricFamily] = {}
 
     # Helper to add metric
-    def add_metric(name: str, value: float, help_text: str = "", labels: Dict[str, str] = None):
-        if help_text:
-            lines.append(f"# HELP {name} {help_text}")
-            lines.append(f"# TYPE {name} gauge")
-
-        if labels:
-            label_str = ",".join(f'{k}="{v}"' for k, v in labels.items())
-            lines.append(f"{name}{{{label_str}}} {value}")
-        else:
-            lines.append(f"{name} {value}")
+    def add_metric(name: str, value: float, label_values: Optional[List[str]] = None):
+        family = families.get(name)
+        if family is None:
+            family = GaugeMetricFamily(name, METRIC_HELP[name], labels=METRIC_LABELS.get(name))
+            families[name] = family
+        family.add_metric(label_values or [], value)
+
+    # Sections below share these; bind them once
+    sol_price = data.get("sol_price")
+    vote_accounts = data.get("vote_accounts") or {}
+    current_votes = vote_accounts.get("current") or []
+    rewards = data.get("inflation_rewards") or {}
+    fees = data.get("epoch_fees") or {}
 
     # ============================================
     # NODE HEALTH & VERSION
     # ============================================
     if data.get("health") is not None:
         health_value = 1 if data["health"] == "ok" else 0
-        add_metric("solana_node_health", health_value, "Node health status (1=healthy, 0=down)")
+        add_metric("solana_node_health", health_value)
 
     if data.get("version"):
         version_info = data["version"]
         version_str = version_info.get("solana-core", "unknown")
         client_type = detect_client_type(version_str)
-        add_metric("solana_node_version_info", 1, "Solana version info", {"version": version_str})
-        add_metric("solana_node_client_info", 1, "Validator client type", {"client": client_type})
+        add_metric("solana_node_version_info", 1, [version_str])
+        add_metric("solana_node_client_info", 1, [client_type])
 
     # ============================================
     # EPOCH & SLOT INFO
     # ============================================
     if data.get("epoch_info"):
         epoch = data["epoch_info"]
-        add_metric("solana_epoch_number", epoch.get("epoch", 0), "Current epoch number")
-        add_metric("solana_epoch_slot_index", epoch.get("slotIndex", 0), "Current slot within epoch")
-        add_metric("solana_epoch_slots_total", epoch.get("slotsInEpoch", 0), "Total slots in current epoch")
-        add_metric("solana_slot_height", epoch.get("absoluteSlot", 0), "Current absolute slot")
-        add_metric("solana_block_height", epoch.get("blockHeight", 0), "Current block height")
-        add_metric("solana_transactions_total", epoch.get("transactionCount", 0), "Total transactions since genesis")
+        for name, field in EPOCH_INFO_GAUGES:
+            add_metric(name, epoch.get(field, 0))
 
         # Calculate epoch progress
         slot_index = epoch.get("slotIndex", 0)
         slots_in_epoch = epoch.get("slotsInEpoch", 1)
-        progress = (slot_index / slots_in_epoch * 100) if slots_in_epoch > 0 else 0
-        add_metric("solana_epoch_progress_percent", progress, "Epoch completion percentage")
-
-    # Cluster slot (for comparison with local validator)
-    if data.get("slot") is not None:
-        add_metric("solana_cluster_slot", data["slot"], "Latest cluster slot")
+        progress = slot_index / slots_in_epoch if slots_in_epoch > 0 else 0
+        add_metric("solana_epoch_progress_ratio", round(progress, 6))
+        add_metric("solana_epoch_progress_percent", progress * 100)
 
     # ============================================
     # NETWORK PERFORMANCE
@@ -640,80 +1335,63 @@ def format_prometheus_metrics(data: Dict[str, Any]) -> str:
     if data.get("performance"):
         perf_samples = data["performance"]
         if perf_samples and len(perf_samples) > 0:
-            # Use most recent sample
-            sample = perf_samples[0]
+            # Aggregate all samples (one per minute) to smooth out jitter
+            num_tx = sum(sample.get("numTransactions", 0) for sample in perf_samples)
+            sample_period = sum(sample.get("samplePeriodSecs", 0) for sample in perf_samples)
+            num_slots = sum(sample.get("numSlots", 0) for sample in perf_samples)
 
             # TPS calculation
-            num_tx = sample.get("numTransactions", 0)
-            sample_period = sample.get("samplePeriodSecs", 1)
             tps = num_tx / sample_period if sample_period > 0 else 0
-            add_metric("solana_network_tps", tps, "Network transactions per second")
+            add_metric("solana_network_tps", tps)
 
             # Average slot time
-            num_slots = sample.get("numSlots", 1)
             avg_slot_ms = (1000 * sample_period / num_slots) if num_slots > 0 else 0
-            add_metric("solana_network_slot_time_ms", avg_slot_ms, "Average time per slot in milliseconds")
+            add_metric("solana_network_slot_time_ms", avg_slot_ms)
 
     # ============================================
     # VALIDATOR BALANCES
     # ============================================
-    if data.get("identity_balance") and data["identity_balance"].get("value") is not None:
-        lamports = data["identity_balance"]["value"]
-        sol = lamports / 1_000_000_000
-        add_metric("solana_validator_identity_balance_sol", sol, "Validator identity account balance (SOL)")
+    identity_lamports, vote_lamports = extract_balances(data.get("multi_balances"))
+
+    if identity_lamports is not None:
+        sol = identity_lamports / 1_000_000_000
+        add_metric("solana_validator_identity_balance_sol", sol)
 
-    if data.get("vote_balance") and data["vote_balance"].get("value") is not None:
-        lamports = data["vote_balance"]["value"]
-        sol = lamports / 1_000_000_000
-        add_metric("solana_validator_vote_balance_sol", sol, "Validator vote account balance (SOL)")
+    if vote_lamports is not None:
+        sol = vote_lamports / 1_000_000_000
+        add_metric("solana_validator_vote_balance_sol", sol)
 
     # ============================================
     # VALIDATOR STAKE & STATUS
     # ============================================
-    if data.get("vote_accounts"):
-        vote_accts = data["vote_accounts"]
-
+    if vote_accounts:
         # Check current (active) validators
-        current = vote_accts.get("current", [])
-        if current and len(current) > 0:
-            validator = current[0]
+        if current_votes:
+            validator = current_votes[0]
 
             # Active stake
             activated_stake = validator.get("activatedStake", 0)
             stake_sol = activated_stake / 1_000_000_000
-            add_metric("solana_validator_activated_stake_sol", stake_sol, "Active stake delegated to validator (SOL)")
-
-            # Last vote
-            last_vote = validator.get("lastVote", 0)
-            add_metric("solana_validator_last_vote_slot", last_vote, "Last voted slot")
+            add_metric("solana_validator_activated_stake_sol", stake_sol)
 
-            # Root slot
-            root_slot = validator.get("rootSlot", 0)
-            add_metric("solana_validator_root_slot", root_slot, "Root slot")
-
-            # Commission
-            commission = validator.get("commission", 0)
-            add_metric("solana_validator_commission_percent", commission, "Validator commission percentage")
+            # Last vote, root slot, commission
+            for name, field in VOTE_ACCOUNT_GAUGES:
+                add_metric(name, validator.get(field, 0))
 
             # Delinquent status (in current = not delinquent)
-            add_metric("solana_validator_delinquent", 0, "Validator delinquency status (0=active, 1=delinquent)")
+            add_metric("solana_validator_delinquent", 0)
 
         # Check delinquent validators
-        delinquent = vote_accts.get("delinquent", [])
+        delinquent = vote_accounts.get("delinquent", [])
         if delinquent and len(delinquent) > 0:
             # Our validator is delinquent!
-            add_metric("solana_validator_delinquent", 1, "Validator delinquency status (0=active, 1=delinquent)")
+            add_metric("solana_validator_delinquent", 1)
 
     # ============================================
     # LEADER SCHEDULE & SLOTS
     # ============================================
-    if data.get("leader_schedule"):
-        leader_schedule = data["leader_schedule"]
-        if Config.IDENTITY_KEY in leader_schedule:
-            assigned_slots = len(leader_schedule[Config.IDENTITY_KEY])
-            add_metric("solana_validator_leader_slots_assigned", assigned_slots, "Number of leader slots assigned this epoch")
-        else:
-            add_metric("solana_validator_leader_slots_assigned", 0, "Number of leader slots assigned this epoch")
+    if data.get("leader_slots_assigned") is not None:
+        add_metric("solana_validator_leader_slots_assigned", data["leader_slots_assigned"])
 
     # ============================================
     # BLOCK PRODUCTION & SKIP RATE
@@ -730,151 +1408,277 @@ def format_prometheus_metrics(data: Dict[str, Any]) -> str:
                 blocks_produced = stats[1] if len(stats) > 1 else 0
                 blocks_skipped = leader_slots - blocks_produced
 
-                add_metric("solana_validator_leader_slots_total", leader_slots, "Total leader slots")
-                add_metric("solana_validator_blocks_produced", blocks_produced, "Blocks successfully produced")
-                add_metric("solana_validator_blocks_skipped", blocks_skipped, "Blocks skipped (missed)")
+                add_metric("solana_validator_leader_slots_total", leader_slots)
+                add_metric("solana_validator_blocks_produced", blocks_produced)
+                add_metric("solana_validator_blocks_skipped", blocks_skipped)
 
                 # Calculate skip rate
                 skip_rate = (blocks_skipped / leader_slots * 100) if leader_slots > 0 else 0
-                add_metric("solana_validator_skip_rate_percent", skip_rate, "Skip rate percentage")
+                add_metric("solana_validator_skip_rate_percent", skip_rate)
 
     # ============================================
     # SOL PRICE & USD CONVERSIONS
     # ============================================
-    sol_price = data.get("sol_price")
     if sol_price is not None:
-        add_metric("solana_sol_price_usd", sol_price, "Current SOL price in USD")
+        add_metric("solana_sol_price_usd", sol_price)
 
         # USD-converted balances
-        if data.get("identity_balance") and data["identity_balance"].get("value") is not None:
-            identity_sol = data["identity_balance"]["value"] / 1_000_000_000
-            add_metric("solana_validator_identity_balance_usd", identity_sol * sol_price, "Identity account balance in USD")
+        if identity_lamports is not None:
+            identity_sol = identity_lamports / 1_000_000_000
+            add_metric("solana_validator_identity_balance_usd", identity_sol * sol_price)
 
-        if data.get("vote_balance") and data["vote_balance"].get("value") is not None:
-            vote_sol = data["vote_balance"]["value"] / 1_000_000_000
-            add_metric("solana_validator_vote_balance_usd", vote_sol * sol_price, "Vote account balance in USD")
+        if vote_lamports is not None:
+            vote_sol = vote_lamports / 1_000_000_000
+            add_metric("solana_validator_vote_balance_usd", vote_sol * sol_price)
 
-        if data.get("vote_accounts"):
-            current = data["vote_accounts"].get("current", [])
-            if current and len(current) > 0:
-                stake_sol = current[0].get("activatedStake", 0) / 1_000_000_000
-                add_metric("solana_validator_activated_stake_usd", stake_sol * sol_price, "Active stake in USD")
+        if current_votes:
+            stake_sol = current_votes[0].get("activatedStake", 0) / 1_000_000_000
+            add_metric("solana_validator_activated_stake_usd", stake_sol * sol_price)
 
     # ============================================
     # INFLATION REWARDS
     # ============================================
-    if data.get("inflation_rewards"):
-        rewards = data["inflation_rewards"]
+    if rewards:
         current_epoch = rewards.get("current_epoch")
 
         if current_epoch:
-            add_metric("solana_validator_current_epoch", current_epoch, "Current epoch number")
+            add_metric("solana_validator_current_epoch", current_epoch)
 
         last_reward = rewards.get("last_epoch_reward")
         if last_reward:
-            add_metric("solana_validator_last_epoch_reward_sol", last_reward["amount_sol"],
-                      "Inflation reward earned last epoch (SOL)")
-            add_metric("solana_validator_last_epoch_reward_epoch", last_reward["epoch"],
-                      "Epoch number for last reward")
+            add_metric("solana_validator_last_epoch_reward_sol", last_reward["amount_sol"])
+            add_metric("solana_validator_last_epoch_reward_epoch", last_reward["epoch"])
 
             # Add USD value if SOL price available
-            sol_price = data.get("sol_price")
             if sol_price:
-                add_metric("solana_validator_last_epoch_reward_usd", last_reward["amount_sol"] * sol_price,
-                          "Inflation reward earned last epoch (USD)")
+                add_metric("solana_validator_last_epoch_reward_usd", last_reward["amount_sol"] * sol_price)
 
         prev_reward = rewards.get("prev_epoch_reward")
         if prev_reward:
-            add_metric("solana_validator_prev_epoch_reward_sol", prev_reward["amount_sol"],
-                      "Inflation reward earned 2 epochs ago (SOL)")
+            add_metric("solana_validator_prev_epoch_reward_sol", prev_reward["amount_sol"])
 
     # ============================================
     # EPOCH FEES (Transaction Fees Earned)
     # ============================================
-    if data.get("epoch_fees"):
-        fees = data["epoch_fees"]
+    if fees:
         total_fees = fees.get("total_fees_sol", 0)
-        add_metric("solana_validator_epoch_fees_total_sol", total_fees,
-                  "Estimated total transaction fees earned this epoch (SOL)")
+        add_metric("solana_validator_epoch_fees_total_sol", total_fees)
 
         avg_fee = fees.get("avg_fee_per_block_sol", 0)
-        add_metric("solana_validator_avg_fee_per_block_sol", avg_fee,
-                  "Average transaction fee per block (SOL)")
+        add_metric("solana_validator_avg_fee_per_block_sol", avg_fee)
 
         blocks_completed = fees.get("blocks_completed", 0)
-        add_metric("solana_validator_blocks_completed_epoch", blocks_completed,
-                  "Number of blocks completed this epoch")
+        add_metric("solana_validator_blocks_completed_epoch", blocks_completed)
 
         # Add USD value if SOL price available
-        sol_price = data.get("sol_price")
         if sol_price and total_fees > 0:
-            add_metric("solana_validator_epoch_fees_total_usd", total_fees * sol_price,
-                      "Estimated total transaction fees earned this epoch (USD)")
+            add_metric("solana_validator_epoch_fees_total_usd", total_fees * sol_price)
 
     # ============================================
     # EXPORTER METADATA
     # ============================================
-    add_metric("solana_exporter_build_info", 1, "Exporter version info", {
-        "version": "1.0.0",
-        "python": "3.8+"
-    })
+    families["solana_exporter_build_info"] = BUILD_INFO
+
+    SNAPSHOT.families = list(families.values())
+    return generate_latest(REGISTRY)
+
+# ------------------------
+# SNAPSHOT REFRESH
+# ------------------------
+async def refresh_metrics(fetch: Callable[[], Awaitable[Dict[str, Any]]] = fetch_all_metrics,
+                          tier: str = "all") -> bytes:
+    """
+    Collect metrics, merge them into _state and store the rendered body in the cache
+
+    Args:
+        fetch: Coroutine function returning the metric data to refresh
+            (one tier, or everything by default)
+        tier: Refresh tier name, used as the label of the scrape metadata
+
+    Returns:
+        Prometheus-formatted metrics body (UTF-8 bytes)
+    """
+    # Monotonic clock for the duration so wall-clock adjustments can't skew it
+    start_time = time.monotonic()
+
+    data = await fetch()
+
+    async with _state_lock:
+        _state.update(data)
+
+        # Format as Prometheus metrics, unless the data is unchanged since last time
+        digest = hashlib.blake2b(orjson.dumps(_state, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+        if digest != _cache["hash"]:
+            # Rendered on a worker thread so /health and cached scrapes aren't held up;
+            # _state can't change meanwhile since every writer holds _state_lock
+            _cache["body"] = await asyncio.get_running_loop().run_in_executor(
+                None, format_prometheus_metrics, _state
+            )
+            _cache["hash"] = digest
+            # Weak: the exporter metadata appended per scrape still changes
+            _cache["etag"] = f'W/"{digest.hex()}"'
+        _cache["exp"] = time.monotonic() + Config.METRICS_CACHE_TTL
+        _snapshot_ready.set()
+
+        # Wake the epoch refresher once the cluster has moved past the epoch
+        # leader_slots_assigned was counted for
+        epoch = (_state.get("epoch_info") or {}).get("epoch")
+        if Config.IDENTITY_KEY and epoch is not None and epoch != _state.get("leader_slots_epoch"):
+            _epoch_changed.set()
+
+    # Record this tier's duration (collection and rendering), timestamp and age
+    end_time = time.monotonic()
+    if tier not in _tier_ts:
+        SNAPSHOT_AGE.labels(tier=tier).set_function(lambda: time.monotonic() - _tier_ts[tier])
+    _tier_ts[tier] = end_time
+    duration = end_time - start_time
+    SCRAPE_DURATION.labels(tier=tier).set(round(duration, 3))
+    SCRAPE_TIMESTAMP.labels(tier=tier).set(int(time.time()))
+
+    logger.info(f"Metrics scraped successfully in {duration:.2f}s ({tier})")
+    return _cache["body"]
+
+async def _refresh_loop(fetch: Callable[[], Awaitable[Dict[str, Any]]], interval: float, tier: str):
+    """Refresh one tier of the metrics snapshot every `interval` seconds"""
+    while True:
+        try:
+            await refresh_metrics(fetch, tier)
+        except Exception as e:
+            # Keep serving the last snapshot; retry on the next tick
+            logger.error(f"Error refreshing metrics ({fetch.__name__}): {e}", exc_info=True)
+        await asyncio.sleep(interval)
+
+async def _epoch_loop():
+    """Refresh per-epoch data (leader schedule) whenever the epoch changes"""
+    while True:
+        await _epoch_changed.wait()
+        _epoch_changed.clear()
+        try:
+            await refresh_metrics(fetch_epoch_metrics, "epoch")
+        except Exception as e:
+            logger.error(f"Error refreshing epoch metrics: {e}", exc_info=True)
+        # A failed schedule fetch re-arms the event; retry at the fast tier's pace
+        await asyncio.sleep(Config.REFRESH_INTERVAL)
+
+async def _blocks_loop():
+    """Rebuild the /blocks table every SOLANA_BLOCKS_REFRESH_INTERVAL seconds"""
+    while True:
+        try:
+            # Reuse the fast tier's epoch info; the schedule and finished blocks
+            # are cached, so usually only newly completed slots hit the RPC
+            _blocks_table["data"] = await fetch_leader_slots_data(_state.get("epoch_info"))
+        except Exception as e:
+            logger.error(f"Error refreshing /blocks table: {e}", exc_info=True)
+        await asyncio.sleep(Config.BLOCKS_REFRESH_INTERVAL)
+
+async def refresh_on_scrape():
+    """Refresh the cache for a scrape, joining the refresh already in flight if there is one"""
+    global _inflight
+    if _inflight is None:
+        _inflight = asyncio.create_task(refresh_metrics())
+        _inflight.add_done_callback(_clear_inflight)
+    # Shielded so a scraper disconnecting does not cancel the refresh for the others
+    await asyncio.shield(_inflight)
+
+def _clear_inflight(task: asyncio.Task):
+    global _inflight
+    _inflight = None
+
+def _snapshot_degraded() -> bool:
+    """
+    Whether a tier's last refresh was partial or its next one is overdue
+
+    The ETag only covers the collected data, so while collection is in
+    trouble the metadata (snapshot age, partial flags) is what changes;
+    /metrics then always sends the full body rather than 304.
+    """
+    if any(_tier_partial.values()):
+        return True
+    now = time.monotonic()
+    intervals = {"fast": Config.REFRESH_INTERVAL, "slow": Config.SLOW_REFRESH_INTERVAL}
+    return any(
+        now - ts > intervals[tier] + Config.TIMEOUT
+        for tier, ts in _tier_ts.items()
+        if tier in intervals
+    )
 
-    return "\n".join(lines)
+def _cache_is_stale() -> bool:
+    """Whether a collect-on-scrape request has to refresh the cache before serving it"""
+    return _cache["body"] is None or time.monotonic() >= _cache["exp"]
 
 # ------------------------
 # HTTP ENDPOINTS
 # ------------------------
+# Static, so serialized once at import
+_ROOT_BODY = orjson.dumps({
+    "name": "Solana Validator Exporter",
+    "version": "1.0.0",
+    "metrics_path": "/metrics",
+    "health_path": "/health"
+})
+
 @app.get("/")
 async def root():
     """Root endpoint with basic info"""
-    return {
-        "name": "Solana Validator Exporter",
-        "version": "1.0.0",
-        "metrics_path": "/metrics",
-        "health_path": "/health"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health():
     """Health check endpoint"""
-    return {"status": "healthy", "timestamp": datetime.utcnow().isoformat()}
+    return {"status": "healthy", "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())}
 
 @app.get("/metrics")
-async def metrics():
+async def metrics(request: Request):
     """
     Prometheus metrics endpoint
 
-    Returns metrics in Prometheus text format
+    Returns metrics in Prometheus text format. Metrics are collected by
+    background tasks (fast-changing data every SOLANA_REFRESH_INTERVAL
+    seconds, slow-changing data every SOLANA_SLOW_REFRESH_INTERVAL seconds,
+    the leader schedule once per epoch) and served from the last snapshot,
+    so scrapes never wait on RPC calls. With the refreshers disabled, the
+    body is cached for SOLANA_METRICS_CACHE_TTL seconds so overlapping
+    scrapes trigger a single round of RPC calls. Scrapes arriving before the
+    background refreshers' first snapshot wait for it (503 after
+    SOLANA_RPC_TIMEOUT seconds) rather than collecting on their own.
+
+    Responses carry an ETag for the snapshot; a matching If-None-Match
+    gets 304 Not Modified without a body, unless a tier is partial or
+    overdue (see _snapshot_degraded).
     """
-    start_time = time.time()
-
     try:
-        # Fetch all metrics
-        data = await fetch_all_metrics()
-
-        # Format as Prometheus metrics
-        metrics_output = format_prometheus_metrics(data)
-
-        # Add scrape duration
-        duration = time.time() - start_time
-        metrics_output += f"\n# HELP solana_exporter_scrape_duration_seconds Time spent scraping metrics\n"
-        metrics_output += f"# TYPE solana_exporter_scrape_duration_seconds gauge\n"
-        metrics_output += f"solana_exporter_scrape_duration_seconds {duration:.3f}\n"
+        if _refresh_tasks:
+            # The refreshers own collection; only the very first scrapes wait
+            cache_hit = _snapshot_ready.is_set()
+            if not cache_hit:
+                try:
+                    await asyncio.wait_for(_snapshot_ready.wait(), Config.TIMEOUT)
+                except asyncio.TimeoutError:
+                    return Response(
+                        content="# Metrics not collected yet\n",
+                        media_type=CONTENT_TYPE_LATEST,
+                        status_code=503
+                    )
+        else:
+            cache_hit = not _cache_is_stale()
+            if not cache_hit:
+                await refresh_on_scrape()
+        CACHE_HIT.set(1 if cache_hit else 0)
 
-        # Add scrape timestamp
-        metrics_output += f"# HELP solana_exporter_scrape_timestamp_seconds Unix timestamp of last scrape\n"
-        metrics_output += f"# TYPE solana_exporter_scrape_timestamp_seconds gauge\n"
-        metrics_output += f"solana_exporter_scrape_timestamp_seconds {time.time():.0f}\n"
+        etag = _cache["etag"]
+        if request.headers.get("if-none-match") == etag and not _snapshot_degraded():
+            return Response(status_code=304, headers={"ETag": etag})
 
-        logger.info(f"Metrics scraped successfully in {duration:.2f}s")
+        # Add scrape metadata and snapshot age so stale data is visible to Prometheus
+        body = _cache["body"] + generate_latest(META_REGISTRY)
 
-        return Response(content=metrics_output, media_type="text/plain; charset=utf-8")
+        return Response(content=body, media_type=CONTENT_TYPE_LATEST, headers={"ETag": etag})
 
     except Exception as e:
         logger.error(f"Error generating metrics: {e}", exc_info=True)
         return Response(
             content=f"# Error generating metrics: {str(e)}\n",
-            media_type="text/plain; charset=utf-8",
+            media_type=CONTENT_TYPE_LATEST,
             status_code=500
         )
 
@@ -883,18 +1687,39 @@ async def blocks():
     """
     Block production endpoint for Grafana Infinity plugin
 
-    Returns JSON with upcoming and completed leader slots
+    Returns JSON with upcoming and completed leader slots, from the table the
+    background refresher rebuilds every SOLANA_BLOCKS_REFRESH_INTERVAL seconds
+    (or a fresh collect-on-scrape snapshot); only fetches them on request
+    when there is none yet or that refresher is disabled
     """
     try:
-        data = await fetch_leader_slots_data()
-        return JSONResponse(content=data)
+        if _refresh_tasks and Config.BLOCKS_REFRESH_INTERVAL > 0:
+            data = _blocks_table["data"]
+        else:
+            # A fresh collect-on-scrape snapshot already carries the table
+            data = _state.get("leader_slots_table") if not _cache_is_stale() else None
+        if data is None:
+            data = await fetch_leader_slots_data()
+        return ORJSONResponse(content=data)
     except Exception as e:
         logger.error(f"Error fetching block data: {e}", exc_info=True)
-        return JSONResponse(
+        return ORJSONResponse(
             content={"error": str(e)},
             status_code=500
         )
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    # uvloop and httptools ship with uvicorn[standard]; uvloop has no Windows build
+    uvicorn.run(
+        # Multiple workers re-import the app in each process
+        app if Config.WORKERS <= 1 else "exporter:app",
+        host="0.0.0.0",
+        port=8080,
+        workers=max(Config.WORKERS, 1),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # Exporter logs its own errors; skip uvicorn's per-request and banner lines
+        log_level="warning",
+        access_log=False
+    )
@@ -122,7 +122,7 @@ echo "Test 9: Checking delinquency status..."
 
 if echo "$METRICS" | grep -q "^solana_validator_delinquent"; then
     DELINQUENT=$(echo "$METRICS" | grep "^solana_validator_delinquent" | awk '{print $2}')
-    if [ "$DELINQUENT" = "0" ]; then
+    if (( $(echo "$DELINQUENT == 0" | bc -l) )); then
         pass "Validator is not delinquent"
     else
         fail "Validator is DELINQUENT - immediate action required!"
@@ -158,8 +158,11 @@ echo ""
 echo "Test 11: Checking scrape performance..."
 
 if echo "$METRICS" | grep -q "^solana_exporter_scrape_duration_seconds"; then
-    SCRAPE_TIME=$(echo "$METRICS" | grep "^solana_exporter_scrape_duration_seconds" | awk '{print $2}')
-    echo "   Last scrape took: ${SCRAPE_TIME}s"
+    # One series per refresh tier; judge the slowest
+    SCRAPE_LINE=$(echo "$METRICS" | grep "^solana_exporter_scrape_duration_seconds" | sort -g -k2 | tail -1)
+    SCRAPE_TIME=$(echo "$SCRAPE_LINE" | awk '{print $2}')
+    SCRAPE_TIER=$(echo "$SCRAPE_LINE" | sed -n 's/.*tier="\([^"]*\)".*/\1/p')
+    echo "   Slowest refresh (${SCRAPE_TIER} tier) took: ${SCRAPE_TIME}s"
 
     if (( $(echo "$SCRAPE_TIME > 10.0" | bc -l) )); then
         warn "Scrape time is slow (>${SCRAPE_TIME}s) - consider using faster RPC"